@@ -46,6 +46,16 @@ warning_texts = ["You don't have enough chips to place this bet!",
                  "Please enter an integer only!"]
 results = False           # Display game summary when user clicks 'Summary'
 round_message = ''        # Message that displays results at end of each round
+# Record and message for each outcome of a round
+outcome_messages = {'bust': ('loss', "You busted!"),
+                    'blackjack draw': ('draw', "You both get blackjack, "
+                                               "it's a draw!"),
+                    'blackjack': ('win', "You win blackjack! Congratulations!"),
+                    'dealer blackjack': ('loss',
+                                         "Dealer gets blackjack! You lose"),
+                    'win': ('win', "You won this round!"),
+                    'loss': ('loss', 'Dealer wins this round!'),
+                    'draw': ('draw', "You have the same value, it's a draw!")}
 
 # Initialize variables that update/reset each round
 dealer_hand = []
@@ -82,28 +92,6 @@ def display_hand(curr_hand, x, y, is_dealer=False):
             screen.blit(image, (x + index * 50, y + index * 10))
 
 
-def is_black_jack(curr_hand):
-    """
-    Checks if a hand is a blackjack.
-    Args:
-        curr_hand (list): Hand to check.
-    Returns:
-        bool: True if blackjacked, False otherwise.
-    """
-    ace = []
-    not_ace = []
-    for card in curr_hand:
-        if card.get_value() == 'A':
-            ace.append(card)
-        else:
-            not_ace.append(card)
-    if len(ace) == 1:
-        if len(not_ace) == 1:
-            if not_ace[0].get_value() in 'JQK10':
-                return True
-    return False
-
-
 def settle_bets(curr_player_hand, curr_dealer_hand, curr_player, curr_bet):
     """
     Settles bets based on player and dealer hands.
@@ -113,38 +101,9 @@ def settle_bets(curr_player_hand, curr_dealer_hand, curr_player, curr_bet):
         curr_player (object): Current player.
         curr_bet (int): Current bet amount.
     """
-    dealer_value = calc_hand(curr_dealer_hand)
-    player_value = calc_hand(curr_player_hand)
-    new_bet = 0
-    message = ''
-    if player_value > 21:    # Player bust, loses bet
-        condition = 'loss'
-        message = "You busted!"
-    elif is_black_jack(curr_player_hand):  # Player Blackjack
-        if is_black_jack(curr_dealer_hand):   # Dealer also gets Blackjack, tie
-            new_bet = curr_bet
-            condition = 'draw'
-            message = "You both get blackjack, it's a draw!"
-        else:                      # Only player has blackjack, wins 2.5 * bet
-            new_bet = curr_bet * 2.5
-            condition = 'win'
-            message = "You win blackjack! Congratulations!"
-    elif is_black_jack(curr_dealer_hand):  # Dealer Blackjack only, loses bet
-        condition = 'loss'
-        message = "Dealer gets blackjack! You lose"
-    else:
-        # Dealer busts or smaller than player
-        if player_value > dealer_value or dealer_value > 21:
-            new_bet = curr_bet * 2
-            condition = 'win'
-            message = "You won this round!"
-        elif player_value < dealer_value:  # Dealer has bigger hand
-            condition = 'loss'
-            message = 'Dealer wins this round!'
-        else:  # Dealer and player has same value
-            new_bet = curr_bet
-            condition = 'draw'
-            message = "You have the same value, it's a draw!"
+    outcome = hand_outcome(curr_player_hand, curr_dealer_hand)
+    new_bet = curr_bet * payouts[outcome]
+    condition, message = outcome_messages[outcome]
     curr_player.tally(condition)
     curr_player.settle(new_bet)
     return True, message
@@ -207,36 +166,6 @@ def make_buttons(betting_status, playing_status,
     return button_list
 
 
-def calc_hand(curr_hand):
-    """
-    Calculates total value of a hand.
-    Args:
-        curr_hand (list): Hand to calculate.
-    Returns:
-        int: Total hand value.
-    """
-    ace = []
-    not_ace = []
-    curr_val = 0
-    for card in curr_hand:
-        if card.get_value() == 'A':
-            ace.append(card)
-        else:
-            not_ace.append(card)
-    for card in not_ace:
-        if card.get_value() in 'JQK':
-            curr_val += 10
-        else:
-            curr_val += int(card.get_value())
-
-    for card in ace:
-        if curr_val <= 10:
-            curr_val += 11
-        else:
-            curr_val += 1
-    return curr_val
-
-
 def display_text(text, x, y):
     """
     Displays text at specified coordinates on the screen.
@@ -2,13 +2,22 @@
 This file includes several basic card models that will be
 used by the blackjack.py file
 """
-import pygame
+import copy
 import random
 
 # List the available suits and values in a deck
 suits = ['Club', 'Spade', 'Heart', 'Diamond']
 values = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K', 'A']
 
+# Chips paid back for each chip bet, by outcome of the round
+payouts = {'bust': 0,
+           'blackjack draw': 1,
+           'blackjack': 2.5,
+           'dealer blackjack': 0,
+           'win': 2,
+           'loss': 0,
+           'draw': 1}
+
 
 class Card:
     """
@@ -17,7 +26,7 @@ class Card:
         suit (str): The suit of the card (e.g., 'Club', 'Spade').
         value (str): The value of the card (e.g., '2', 'A').
         image (pygame.Surface): The pygame image object 
-        representing the card's visual.
+        representing the card's visual, loaded on first use.
     Methods:
         get_value: Returns the value of the card.
         get_image: Returns the pygame image of the card.
@@ -36,7 +45,9 @@ class Card:
         self.suit = suit
         # The value of the card.
         self.value = value
-        self.image = pygame.image.load('images/' + self.suit + self.value + '.png')
+        # The image is only loaded when the card is drawn on screen, so
+        # decks can be built and dealt without a display (e.g. simulations).
+        self.image = None
     
     # Returns the face value of the card.
     def get_value(self):
@@ -44,6 +55,10 @@ class Card:
         
     # Returns the pygame image associated with the card.
     def get_image(self):
+        if self.image is None:
+            # Imported here so decks can be used without pygame installed
+            import pygame
+            self.image = pygame.image.load('images/' + self.suit + self.value + '.png')
         return self.image
 
 
@@ -52,29 +67,51 @@ class Deck:
     Represents a deck of playing cards.
     Attributes:
         cards (list of Card): A list of Card objects representing the deck.
+        shoe (list of Card): All the cards of a full shoe, in a fixed order.
+        rng (random.Random): The random generator used for shuffling,
+        the module-level random generator if the deck is not seeded.
     Methods:
         shuffle_deck: Shuffles the cards in the deck randomly.
         deal_card: Deals and returns the top card from the deck.
         length: Returns the number of cards remaining in the deck.
+        reset: Puts all the cards back and shuffles them.
+        copy: Returns an independent deck in the same state.
     """
     
-    def __init__(self):
+    def __init__(self, seed=None):
         """
         Initializes the Deck instance with 52 cards
         and shuffles them.
+        Args:
+            seed (int): Optional seed, so the same shoe (including any
+            reshuffles) can be dealt again. Uses the module-level
+            random generator if None.
         """
-        self.cards = []
+        self.shoe = []
         for i in range(4):
             for suit in suits:
                 for value in values:
-                    self.cards.append(Card(suit, value))
-        self.shuffle_deck()
+                    self.shoe.append(Card(suit, value))
+        self.rng = random
+        self.reset(seed)
 
     def shuffle_deck(self):
         """
         Randomly shuffles the cards in the deck.
         """
-        random.shuffle(self.cards)
+        self.rng.shuffle(self.cards)
+
+    def reset(self, seed=None):
+        """
+        Puts all the cards back in the deck and shuffles them.
+        Args:
+            seed (int): Optional seed for this and later shuffles.
+            Keeps the current random generator if None.
+        """
+        if seed is not None:
+            self.rng = random.Random(seed)
+        self.cards = list(self.shoe)
+        self.shuffle_deck()
 
     def deal_card(self):
         """
@@ -84,15 +121,9 @@ class Deck:
         """
 
         # Reinitialize the deck if it's empty
-        if len(self.cards) >= 1:
-            return self.cards.pop()
-        else:
-            for i in range(4):
-                for suit in suits:
-                    for value in values:
-                        self.cards.append(Card(suit, value))
-            self.shuffle_deck()
-            return self.cards.pop()
+        if len(self.cards) < 1:
+            self.reset()
+        return self.cards.pop()
     
     # Returns the number of cards currently in the deck.
     def length(self):
@@ -102,6 +133,98 @@ class Deck:
         """
         return len(self.cards)
 
+    def copy(self):
+        """
+        Returns:
+            Deck: a new deck with the same remaining cards and shuffle
+            state, which deals exactly the same cards as this one
+        """
+        replay = copy.copy(self)
+        replay.cards = list(self.cards)
+        # A constant seed skips reading OS entropy, setstate replaces it
+        replay.rng = random.Random(0)
+        replay.rng.setstate(self.rng.getstate())
+        return replay
+
+
+def is_black_jack(curr_hand):
+    """
+    Checks if a hand is a blackjack.
+    Args:
+        curr_hand (list): Hand to check.
+    Returns:
+        bool: True if blackjacked, False otherwise.
+    """
+    ace = []
+    not_ace = []
+    for card in curr_hand:
+        if card.get_value() == 'A':
+            ace.append(card)
+        else:
+            not_ace.append(card)
+    if len(ace) == 1:
+        if len(not_ace) == 1:
+            if not_ace[0].get_value() in 'JQK10':
+                return True
+    return False
+
+
+def calc_hand(curr_hand):
+    """
+    Calculates total value of a hand.
+    Args:
+        curr_hand (list): Hand to calculate.
+    Returns:
+        int: Total hand value.
+    """
+    ace = []
+    not_ace = []
+    curr_val = 0
+    for card in curr_hand:
+        if card.get_value() == 'A':
+            ace.append(card)
+        else:
+            not_ace.append(card)
+    for card in not_ace:
+        if card.get_value() in 'JQK':
+            curr_val += 10
+        else:
+            curr_val += int(card.get_value())
+
+    for card in ace:
+        if curr_val <= 10:
+            curr_val += 11
+        else:
+            curr_val += 1
+    return curr_val
+
+
+def hand_outcome(curr_player_hand, curr_dealer_hand):
+    """
+    Decides the outcome of a finished round.
+    Args:
+        curr_player_hand (list): The player's hand.
+        curr_dealer_hand (list): The dealer's hand.
+    Returns:
+        str: The outcome, one of the keys of payouts.
+    """
+    dealer_value = calc_hand(curr_dealer_hand)
+    player_value = calc_hand(curr_player_hand)
+    if player_value > 21:    # Player bust, loses bet
+        return 'bust'
+    elif is_black_jack(curr_player_hand):  # Player Blackjack
+        if is_black_jack(curr_dealer_hand):   # Dealer also gets Blackjack, tie
+            return 'blackjack draw'
+        return 'blackjack'
+    elif is_black_jack(curr_dealer_hand):  # Dealer Blackjack only, loses bet
+        return 'dealer blackjack'
+    # Dealer busts or smaller than player
+    elif player_value > dealer_value or dealer_value > 21:
+        return 'win'
+    elif player_value < dealer_value:  # Dealer has bigger hand
+        return 'loss'
+    return 'draw'
+
 
 class Player:
     """
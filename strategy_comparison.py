@@ -0,0 +1,388 @@
+"""
+This module compares blackjack playing and betting strategies
+without the Pygame interface. Every strategy is played on exactly
+the same seeded shoes (common random numbers), so the EV difference
+between two strategies is measured on paired hands. Only the noise
+the strategies share cancels out: once they act differently on a
+hand they draw different cards, so the gain is largest for strategies
+that play most hands the same way. The comparison can stop early once
+every difference is significant; the early checks need much stronger
+evidence, so the intervals stay valid whenever the run stops.
+"""
+import math
+import random
+from statistics import NormalDist
+
+from deck_model import Deck, calc_hand, hand_outcome, payouts
+
+
+class Strategy:
+    """
+    Represents a way of playing and betting a hand.
+    Attributes:
+        name (str): The name shown in the comparison report.
+        decide (callable): Takes the player's hand and the dealer's
+        face up card and returns 'hit', 'stand' or 'double'. A double
+        after the first two cards is not allowed and counts as a stand.
+        bet (callable): Takes the deck before the round is dealt and
+        returns the amount to bet. Always bets 1 if None.
+    """
+
+    def __init__(self, name, decide, bet=None):
+        """
+        Initializes a strategy with a playing rule and a betting rule.
+        Args:
+            name (str): The name of the strategy.
+            decide (callable): The playing rule.
+            bet (callable): The betting rule, flat betting if None.
+        """
+        self.name = name
+        self.decide = decide
+        self.bet = bet if bet is not None else flat_bet
+
+
+class RunningStats:
+    """
+    Keeps the mean and variance of a stream of numbers
+    without storing them (Welford's algorithm).
+    Attributes:
+        count (int): Number of values added.
+        mean (float): Mean of the values added.
+        total_sq (float): Sum of squared distances from the mean.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.total_sq = 0.0
+
+    def add(self, value):
+        """
+        Adds a value to the running statistics.
+        Args:
+            value (float): The value to add.
+        """
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.total_sq += delta * (value - self.mean)
+
+    def variance(self):
+        """
+        Returns:
+            float: the sample variance, 0 with fewer than 2 values
+        """
+        if self.count < 2:
+            return 0.0
+        return self.total_sq / (self.count - 1)
+
+    def half_width(self, z):
+        """
+        Args:
+            z (float): The normal quantile of the confidence level.
+        Returns:
+            float: half width of the confidence interval of the mean
+        """
+        if self.count < 2:
+            return math.inf
+        return z * math.sqrt(self.variance() / self.count)
+
+
+def flat_bet(curr_deck):
+    """
+    Bets the same single chip every round.
+    Args:
+        curr_deck (Deck): The deck before the round is dealt.
+    Returns:
+        int: The bet amount.
+    """
+    return 1
+
+
+def mimic_dealer(curr_player_hand, dealer_card):
+    """
+    Plays like the dealer: hits until 17 is reached.
+    Args:
+        curr_player_hand (list): The player's hand.
+        dealer_card (Card): The dealer's face up card.
+    Returns:
+        str: The action to take.
+    """
+    if calc_hand(curr_player_hand) < 17:
+        return 'hit'
+    return 'stand'
+
+
+def never_bust(curr_player_hand, dealer_card):
+    """
+    Only hits when the next card cannot bust the hand.
+    Args:
+        curr_player_hand (list): The player's hand.
+        dealer_card (Card): The dealer's face up card.
+    Returns:
+        str: The action to take.
+    """
+    if calc_hand(curr_player_hand) < 12:
+        return 'hit'
+    return 'stand'
+
+
+def round_result(curr_player_hand, curr_dealer_hand, curr_bet):
+    """
+    Net chips won or lost on a finished round, paid out the
+    same way as settle_bets in blackjack.py.
+    Args:
+        curr_player_hand (list): The player's hand.
+        curr_dealer_hand (list): The dealer's hand.
+        curr_bet (int): Total amount bet on the round.
+    Returns:
+        float: The net result of the round.
+    """
+    outcome = hand_outcome(curr_player_hand, curr_dealer_hand)
+    return curr_bet * payouts[outcome] - curr_bet
+
+
+def play_round(strategy, curr_deck):
+    """
+    Plays one round against the dealer, dealing cards in the same
+    order as the game does. The game ignores a double after the first
+    two cards and waits for another button; here it counts as a stand,
+    since asking the strategy again would return the same answer.
+    Args:
+        strategy (Strategy): The strategy playing the hand.
+        curr_deck (Deck): The deck of cards being used.
+    Returns:
+        float: The net result of the round.
+    Raises:
+        ValueError: If the strategy returns an unknown action.
+    """
+    curr_bet = strategy.bet(curr_deck)
+    dealer_hand = []
+    player_hand = []
+    for i in range(2):
+        dealer_hand.append(curr_deck.deal_card())
+        player_hand.append(curr_deck.deal_card())
+
+    # The dealer's second card is face down, only the first is shown
+    while calc_hand(player_hand) < 21:
+        action = strategy.decide(player_hand, dealer_hand[0])
+        if action == 'hit':
+            player_hand.append(curr_deck.deal_card())
+        elif action == 'double':
+            if len(player_hand) == 2:
+                player_hand.append(curr_deck.deal_card())
+                curr_bet = curr_bet * 2
+            break
+        elif action == 'stand':
+            break
+        else:
+            raise ValueError(f'Unknown action {action!r} from {strategy.name}')
+
+    # Dealer hits when value is < 17, even if the player busted
+    while calc_hand(dealer_hand) < 17:
+        dealer_hand.append(curr_deck.deal_card())
+    return round_result(player_hand, dealer_hand, curr_bet)
+
+
+def play_shoe(strategy, curr_deck, hands_per_shoe):
+    """
+    Plays several rounds in a row from the same deck.
+    Args:
+        strategy (Strategy): The strategy playing the hands.
+        curr_deck (Deck): The deck of cards being used.
+        hands_per_shoe (int): Number of rounds to play.
+    Returns:
+        float: The mean net result per round.
+    """
+    total = 0
+    for i in range(hands_per_shoe):
+        total += play_round(strategy, curr_deck)
+    return total / hands_per_shoe
+
+
+def look_schedule(max_shoes, min_shoes, growth):
+    """
+    Shoe counts at which compare_strategies looks at the intervals:
+    first after min_shoes, then growth times as many each time, and
+    always at max_shoes.
+    Args:
+        max_shoes (int): Maximum number of shoes to play.
+        min_shoes (int): Shoes to play before the first look.
+        growth (float): How much the shoe count grows between looks.
+    Returns:
+        list of int: The shoe counts, ending with max_shoes.
+    """
+    looks = []
+    shoes = min_shoes
+    while shoes < max_shoes:
+        looks.append(shoes)
+        shoes = max(math.ceil(shoes * growth), shoes + 1)
+    looks.append(max_shoes)
+    return looks
+
+
+def look_levels(looks, confidence):
+    """
+    Normal quantiles for the intervals at each look. The error rate
+    1 - confidence is spent with an O'Brien-Fleming type function, so
+    early looks are strict and the last one stays close to a single
+    fixed-size interval. The spent rates add up to 1 - confidence, so
+    the intervals hold at whichever look the comparison stops.
+    Args:
+        looks (list of int): The shoe counts from look_schedule.
+        confidence (float): Confidence level of the intervals.
+    Returns:
+        list of float: One quantile per look, inf if a look spends
+        nothing and so can never stop the comparison.
+    """
+    normal = NormalDist()
+    z = normal.inv_cdf((1 + confidence) / 2)
+    levels = []
+    spent = 0.0
+    for shoes in looks:
+        fraction = shoes / looks[-1]
+        total = 2 * (1 - normal.cdf(z / math.sqrt(fraction)))
+        if shoes == looks[-1]:
+            total = 1 - confidence
+        if total > spent:
+            levels.append(normal.inv_cdf(1 - (total - spent) / 2))
+        else:
+            levels.append(math.inf)
+        spent = max(total, spent)
+    return levels
+
+
+def compare_strategies(strategies, max_shoes=100000, hands_per_shoe=1,
+                       seed=0, confidence=0.95, min_shoes=1000,
+                       growth=2, stop_early=True):
+    """
+    Plays every strategy on the same seeded shoes and estimates the
+    EV difference of each strategy against the first one.
+
+    With hands_per_shoe=1 every strategy starts each hand from the
+    same shoe, which gives the tightest pairing. Betting strategies
+    that depend on the cards already seen need more hands per shoe,
+    but the pairing weakens as the strategies draw different cards.
+
+    When stop_early is True, significance is checked after min_shoes
+    shoes and then each time the shoe count has grown growth times.
+    Checking repeatedly at a fixed level would find differences that
+    are not there far more often than 1 - confidence, so the error
+    rate is spread over the looks by look_levels: the early looks need
+    strong evidence and the last one is only slightly wider than a
+    single fixed-size interval. If the run reaches max_shoes the
+    fixed-size interval is reported too; it is the usual interval
+    for that many shoes but does not account for the earlier looks.
+    Args:
+        strategies (list of Strategy): The strategies to compare,
+        the first one is the baseline.
+        max_shoes (int): Maximum number of shoes to play.
+        hands_per_shoe (int): Rounds played from each shoe.
+        seed (int): Seed of the stream the shoe seeds are drawn from,
+        so runs with different seeds use different shoes.
+        confidence (float): Confidence level of the intervals.
+        min_shoes (int): Shoes to play before the first check.
+        growth (float): How much the shoe count grows between checks.
+        stop_early (bool): Stop once every difference is significant.
+    Returns:
+        list of dict: One entry per strategy after the baseline, with
+        the mean difference per hand, its confidence interval, and
+        the variance ratio of unpaired over paired runs.
+        The intervals use the same corrected width as the stopping rule;
+        fixed_low and fixed_high are the fixed-size interval, or None
+        if the run stopped early.
+    Raises:
+        ValueError: If fewer than two strategies are given or an
+        argument is out of range.
+    """
+    if len(strategies) < 2:
+        raise ValueError('Need at least two strategies to compare')
+    if not 0 < confidence < 1:
+        raise ValueError('Confidence must be between 0 and 1')
+    if growth <= 1:
+        raise ValueError('growth must be more than 1')
+    if min_shoes < 1 or max_shoes < 1 or hands_per_shoe < 1:
+        raise ValueError('min_shoes, max_shoes and hands_per_shoe '
+                         'must be at least 1')
+    looks = [max_shoes]
+    if stop_early:
+        looks = look_schedule(max_shoes, min_shoes, growth)
+    levels = look_levels(looks, confidence)
+    z = levels[-1]
+    results = [RunningStats() for strategy in strategies]
+    differences = [RunningStats() for strategy in strategies[1:]]
+
+    seeds = random.Random(seed)
+    shoe = Deck(seed)
+    shoes = 0
+    while shoes < max_shoes:
+        shoe.reset(seeds.getrandbits(64))
+        outcomes = [play_shoe(strategy, shoe.copy(), hands_per_shoe)
+                    for strategy in strategies]
+        for stats, outcome in zip(results, outcomes):
+            stats.add(outcome)
+        for stats, outcome in zip(differences, outcomes[1:]):
+            stats.add(outcome - outcomes[0])
+        shoes += 1
+
+        if shoes in looks:
+            z = levels[looks.index(shoes)]
+            if all(abs(stats.mean) > stats.half_width(z)
+                   for stats in differences):
+                break
+
+    fixed_z = NormalDist().inv_cdf((1 + confidence) / 2)
+
+    summary = []
+    for strategy, stats, diff in zip(strategies[1:], results[1:],
+                                     differences):
+        half_width = diff.half_width(z)
+        fixed_low = fixed_high = None
+        if shoes == max_shoes:
+            fixed_low = diff.mean - diff.half_width(fixed_z)
+            fixed_high = diff.mean + diff.half_width(fixed_z)
+        unpaired = results[0].variance() + stats.variance()
+        if diff.variance() > 0:
+            variance_ratio = unpaired / diff.variance()
+        else:
+            variance_ratio = math.inf
+        summary.append({'name': strategy.name,
+                        'baseline': strategies[0].name,
+                        'difference': diff.mean,
+                        'low': diff.mean - half_width,
+                        'high': diff.mean + half_width,
+                        'significant': abs(diff.mean) > half_width,
+                        'fixed_low': fixed_low,
+                        'fixed_high': fixed_high,
+                        'variance_ratio': variance_ratio,
+                        'shoes': shoes,
+                        'hands': shoes * hands_per_shoe})
+    return summary
+
+
+def print_comparison(summary):
+    """
+    Prints the result of compare_strategies.
+    Args:
+        summary (list of dict): The output of compare_strategies.
+    """
+    for entry in summary:
+        if math.isinf(entry['variance_ratio']):
+            gain = 'no variance left after pairing'
+        else:
+            gain = (f"{entry['variance_ratio']:.1f}x less variance "
+                    f"than unpaired")
+        print(f"{entry['name']} - {entry['baseline']}: "
+              f"{entry['difference']:+.4f} per hand "
+              f"[{entry['low']:+.4f}, {entry['high']:+.4f}] "
+              f"after {entry['hands']} hands, {gain}")
+        if entry['fixed_low'] is not None:
+            print(f"    fixed-size interval "
+                  f"[{entry['fixed_low']:+.4f}, {entry['fixed_high']:+.4f}]")
+
+
+if __name__ == '__main__':
+    print_comparison(compare_strategies([Strategy('Mimic dealer',
+                                                  mimic_dealer),
+                                         Strategy('Never bust',
+                                                  never_bust)]))
@@ -0,0 +1,51 @@
+"""
+Tests for the seeded decks and hand rules in deck_model.py
+"""
+import pytest
+
+from deck_model import Card, Deck, calc_hand, hand_outcome, payouts
+
+
+def hand(*card_values):
+    return [Card('Club', value) for value in card_values]
+
+
+def deal_values(curr_deck, count):
+    return [curr_deck.deal_card().get_value() for i in range(count)]
+
+
+def test_same_seed_deals_same_cards_across_reshuffle():
+    # 300 cards is more than one 208 card shoe
+    assert deal_values(Deck(7), 300) == deal_values(Deck(7), 300)
+
+
+def test_copy_deals_same_cards_across_reshuffle():
+    original = Deck(7)
+    deal_values(original, 50)
+    replay = original.copy()
+    assert deal_values(original, 300) == deal_values(replay, 300)
+
+
+def test_reset_replays_seeded_deck():
+    curr_deck = Deck(1)
+    curr_deck.reset(7)
+    assert deal_values(curr_deck, 300) == deal_values(Deck(7), 300)
+
+
+def test_calc_hand_counts_aces():
+    assert calc_hand(hand('A', 'K')) == 21
+    assert calc_hand(hand('A', 'A', '9')) == 21
+    assert calc_hand(hand('A', '5', 'K')) == 16
+
+
+def test_hand_outcome():
+    assert hand_outcome(hand('K', 'Q', '5'), hand('K', '7')) == 'bust'
+    assert hand_outcome(hand('A', 'K'), hand('A', '10')) == 'blackjack draw'
+    assert hand_outcome(hand('A', 'K'), hand('K', 'Q')) == 'blackjack'
+    assert hand_outcome(hand('K', 'Q'), hand('A', 'J')) == 'dealer blackjack'
+    assert hand_outcome(hand('K', 'Q'), hand('K', '7')) == 'win'
+    assert hand_outcome(hand('K', '7'), hand('K', 'Q', '5')) == 'win'
+    assert hand_outcome(hand('K', '7'), hand('K', '8')) == 'loss'
+    assert hand_outcome(hand('K', '7'), hand('10', '7')) == 'draw'
+    assert set(payouts) >= {'bust', 'blackjack draw', 'blackjack',
+                            'dealer blackjack', 'win', 'loss', 'draw'}
@@ -0,0 +1,145 @@
+"""
+Tests for the strategy comparison harness in strategy_comparison.py
+"""
+import random
+import statistics
+
+import pytest
+
+from deck_model import Card, Deck, Player
+from strategy_comparison import (RunningStats, Strategy, compare_strategies,
+                                 look_levels, look_schedule, mimic_dealer,
+                                 never_bust, play_round, print_comparison,
+                                 round_result)
+
+
+def hand(*card_values):
+    return [Card('Club', value) for value in card_values]
+
+
+def stacked_deck(*card_values):
+    """
+    A deck dealing the given values in order: dealer, player,
+    dealer, player, then the player's and the dealer's hits.
+    """
+    curr_deck = Deck(0)
+    curr_deck.cards = list(reversed(hand(*card_values)))
+    return curr_deck
+
+
+@pytest.mark.parametrize('player_values, dealer_values, bet, chips', [
+    (('K', 'Q', '5'), ('K', '7'), 10, 490),      # Bust loses the bet
+    (('A', 'K'), ('A', 'Q'), 10, 500),           # Both blackjack, draw
+    (('A', 'K'), ('9', 'Q'), 10, 515),           # Blackjack pays 2.5 * bet
+    (('K', 'Q'), ('A', 'J'), 10, 490),           # Dealer blackjack
+    (('5', '6', 'K'), ('9', 'Q'), 20, 520),      # Doubled hand wins
+    (('9', '9'), ('9', '9'), 10, 500),           # Same value, draw
+])
+def test_round_result_matches_game_settlement(player_values, dealer_values,
+                                              bet, chips):
+    # Chips the player ends with in the game after betting and settling
+    curr_player = Player(500, 0)
+    curr_player.bet(bet)
+    curr_player.settle(bet + round_result(hand(*player_values),
+                                          hand(*dealer_values), bet))
+    assert curr_player.chips == chips
+
+
+def test_double_doubles_the_bet():
+    always_double = Strategy('Double', lambda curr_hand, card: 'double')
+    assert play_round(always_double, stacked_deck('K', '5', '7', '6',
+                                                  '10')) == 2
+    assert play_round(always_double, stacked_deck('K', '5', '7', '6',
+                                                  '2')) == -2
+
+
+def test_double_after_two_cards_stands():
+    def hit_then_double(curr_hand, card):
+        return 'hit' if len(curr_hand) == 2 else 'double'
+    strategy = Strategy('Late double', hit_then_double)
+    # Player 5, 6, hits 2 then stands on 13 against the dealer's 17
+    assert play_round(strategy, stacked_deck('K', '5', '7', '6', '2')) == -1
+
+
+def test_unknown_action_raises():
+    with pytest.raises(ValueError):
+        play_round(Strategy('Split', lambda curr_hand, card: 'split'),
+                   stacked_deck('K', '8', '7', '8'))
+
+
+def test_running_stats_matches_statistics():
+    rng = random.Random(3)
+    data = [rng.gauss(0, 2) for i in range(500)]
+    stats = RunningStats()
+    for value in data:
+        stats.add(value)
+    assert stats.count == 500
+    assert stats.mean == pytest.approx(statistics.mean(data))
+    assert stats.variance() == pytest.approx(statistics.variance(data))
+
+
+def test_identical_strategies_have_no_difference(capsys):
+    summary = compare_strategies([Strategy('A', mimic_dealer),
+                                  Strategy('B', mimic_dealer)],
+                                 max_shoes=2000)
+    assert summary[0]['difference'] == 0
+    assert not summary[0]['significant']
+    assert summary[0]['shoes'] == 2000
+    print_comparison(summary)
+    assert 'no variance left after pairing' in capsys.readouterr().out
+
+
+def test_clear_difference_stops_at_first_look():
+    always_stand = Strategy('Stand', lambda curr_hand, card: 'stand')
+    always_hit = Strategy('Hit', lambda curr_hand, card: 'hit')
+    summary = compare_strategies([always_stand, always_hit],
+                                 max_shoes=800, min_shoes=200)
+    assert summary[0]['significant']
+    assert summary[0]['difference'] < 0
+    assert summary[0]['shoes'] == 200
+    assert summary[0]['fixed_low'] is None
+
+
+def test_fixed_interval_reported_at_max_shoes():
+    summary = compare_strategies([Strategy('A', mimic_dealer),
+                                  Strategy('B', never_bust)],
+                                 max_shoes=300, min_shoes=100)
+    entry = summary[0]
+    assert entry['shoes'] == 300
+    assert entry['low'] <= entry['fixed_low'] < entry['fixed_high'] \
+        <= entry['high']
+
+
+@pytest.mark.parametrize('max_shoes, min_shoes, growth, looks', [
+    (1000, 100, 2, [100, 200, 400, 800, 1000]),
+    (800, 100, 2, [100, 200, 400, 800]),         # Last look at max_shoes
+    (1000, 150, 3, [150, 450, 1000]),
+    (1000, 1500, 2, [1000]),                     # min_shoes > max_shoes
+    (5, 1, 1.1, [1, 2, 3, 4, 5]),                # Always at least one more
+])
+def test_look_schedule(max_shoes, min_shoes, growth, looks):
+    assert look_schedule(max_shoes, min_shoes, growth) == looks
+
+
+def test_look_levels_spend_the_error_rate():
+    normal = statistics.NormalDist()
+    looks = look_schedule(100000, 1000, 2)
+    levels = look_levels(looks, 0.95)
+    spent = sum(2 * (1 - normal.cdf(z)) for z in levels)
+    assert spent == pytest.approx(0.05)
+    assert levels == sorted(levels, reverse=True)
+    assert 1.96 < levels[-1] < 2.2
+    assert look_levels([1000], 0.95) == [pytest.approx(1.959964, abs=1e-6)]
+
+
+@pytest.mark.parametrize('kwargs', [
+    {'growth': 1},
+    {'min_shoes': 0},
+    {'confidence': 0},
+    {'confidence': 1.5},
+    {'max_shoes': 0},
+])
+def test_invalid_arguments_raise(kwargs):
+    with pytest.raises(ValueError):
+        compare_strategies([Strategy('A', mimic_dealer),
+                            Strategy('B', mimic_dealer)], **kwargs)